@@ -10,75 +10,11 @@
 REPOSITORY_URL = "https://github.com/hdl-registers/hdl-registers"
 WEBSITE_URL = "https://hdl-registers.com"
 
-
-def get_short_slogan() -> str:
-    """
-    Short slogan used e.g. on pypi.org.
-    Note that there seems to be an upper limit of 98 characters when rendering the slogan
-    on pypi.org.
-
-    Note that this slogan should be the same as the one used in the readme and on the website below.
-    The difference is capitalization and whether the project name is included.
-    """
-    result = "An open-source HDL register interface code generator fast enough to run in real time"
-    return result
-
-
-def get_readme_rst(
-    include_extra_for_github: bool = False,
-    include_extra_for_website: bool = False,
-    include_extra_for_pypi: bool = False,
-) -> str:
-    """
-    Get the complete README.rst (to be used on website and in PyPI release).
-    RST file inclusion in README.rst does not work on GitHub unfortunately, hence this
-    cumbersome handling where the README is duplicated in two places.
-
-    The arguments control some extra text that is included. This is mainly links to the
-    other places where you can find information on the project (website, GitHub, PyPI).
-
-    Arguments:
-        include_extra_for_github (bool): Include the extra text that shall be included in the
-            GitHub README.
-        include_extra_for_website (bool): Include the extra text that shall be included in the
-            website main page.
-        include_extra_for_pypi (bool): Include the extra text that shall be included in the
-            PyPI release README.
-    """
-    if include_extra_for_github:
-        readme_rst = ""
-        extra_rst = f"""\
-**See documentation on the website**: {WEBSITE_URL}
-
-"""
-    elif include_extra_for_website:
-        # The website needs the initial heading, in order for the landing page to get
-        # the correct title.
-        # The others do not need this initial heading, it just makes the GitHub/PyPI page
-        # more clunky.
-        readme_rst = """\
-About hdl-registers
-===================
-
-"""
-        extra_rst = f"""\
-To install the Python package, see :ref:`installation`.
-To check out the source code go to the
-`GitHub page <{REPOSITORY_URL}>`__. \
-"""
-    elif include_extra_for_pypi:
-        readme_rst = ""
-        extra_rst = f"""\
-**See documentation on the website**: {WEBSITE_URL}
-
-**Check out the source code on GitHub**: {REPOSITORY_URL}
-
-"""
-    else:
-        readme_rst = ""
-        extra_rst = ""
-
-    readme_rst += f"""\
+# Main part of the README, that is the same in all use cases.
+# Formatted with the URLs once when the module is loaded, rather than on every call.
+# The '{extra_rst}' marker is replaced by 'get_readme_rst'. It is a plain string replacement,
+# not a second formatting pass, so braces need no escaping beyond the f-string itself.
+_README_RST_BODY = f"""\
 .. image:: {WEBSITE_URL}/logos/banner.png
   :alt: Project banner
   :align: center
@@ -123,7 +59,7 @@ It makes FPGA/ASIC development more fun by automating a lot of time-consuming ma
 It also minimizes the risk of bugs by removing the need for duplicate information.
 `Read more <{WEBSITE_URL}/rst/about/about.html>`_
 
-{extra_rst}The following features are supported:
+{{extra_rst}}The following features are supported:
 
 * Register fields
 
@@ -169,4 +105,74 @@ The maintainers place high focus on quality, with everything having good unit te
 thought-out structure.
 """
 
+
+def get_short_slogan() -> str:
+    """
+    Short slogan used e.g. on pypi.org.
+    Note that there seems to be an upper limit of 98 characters when rendering the slogan
+    on pypi.org.
+
+    Note that this slogan should be the same as the one used in the readme and on the website below.
+    The difference is capitalization and whether the project name is included.
+    """
+    result = "An open-source HDL register interface code generator fast enough to run in real time"
+    return result
+
+
+def get_readme_rst(
+    include_extra_for_github: bool = False,
+    include_extra_for_website: bool = False,
+    include_extra_for_pypi: bool = False,
+) -> str:
+    """
+    Get the complete README.rst (to be used on website and in PyPI release).
+    RST file inclusion in README.rst does not work on GitHub unfortunately, hence this
+    cumbersome handling where the README is duplicated in two places.
+
+    The arguments control some extra text that is included. This is mainly links to the
+    other places where you can find information on the project (website, GitHub, PyPI).
+
+    Arguments:
+        include_extra_for_github (bool): Include the extra text that shall be included in the
+            GitHub README.
+        include_extra_for_website (bool): Include the extra text that shall be included in the
+            website main page.
+        include_extra_for_pypi (bool): Include the extra text that shall be included in the
+            PyPI release README.
+    """
+    if include_extra_for_github:
+        readme_rst = ""
+        extra_rst = f"""\
+**See documentation on the website**: {WEBSITE_URL}
+
+"""
+    elif include_extra_for_website:
+        # The website needs the initial heading, in order for the landing page to get
+        # the correct title.
+        # The others do not need this initial heading, it just makes the GitHub/PyPI page
+        # more clunky.
+        readme_rst = """\
+About hdl-registers
+===================
+
+"""
+        extra_rst = f"""\
+To install the Python package, see :ref:`installation`.
+To check out the source code go to the
+`GitHub page <{REPOSITORY_URL}>`__. \
+"""
+    elif include_extra_for_pypi:
+        readme_rst = ""
+        extra_rst = f"""\
+**See documentation on the website**: {WEBSITE_URL}
+
+**Check out the source code on GitHub**: {REPOSITORY_URL}
+
+"""
+    else:
+        readme_rst = ""
+        extra_rst = ""
+
+    readme_rst += _README_RST_BODY.replace("{extra_rst}", extra_rst)
+
     return readme_rst
@@ -148,9 +148,10 @@ class Enumeration(RegisterField):
         Return:
             The enumeration element with the provided value.
         """
-        for element in self._elements:
-            if element.value == value:
-                return element
+        # Element values are sequential starting from zero, and can not be changed.
+        # Hence the value is also the index of the element in the list.
+        if 0 <= value < len(self._elements):
+            return self._elements[value]
 
         message = (
             f'Enumeration "{self.name}", requested element value does not exist. Got: "{value}".'
@@ -125,6 +125,13 @@ def test_get_element_by_value_with_invalid_value_should_raise_exception():
         == 'Enumeration "apa", requested element value does not exist. Got: "1".'
     )
 
+    with pytest.raises(ValueError) as exception_info:
+        enumeration.get_element_by_value(-1)
+    assert (
+        str(exception_info.value)
+        == 'Enumeration "apa", requested element value does not exist. Got: "-1".'
+    )
+
 
 def test_setting_default_value():
     enumeration = Enumeration(
@@ -9,7 +9,7 @@
 
 # Standard libraries
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 # First party libraries
 from hdl_registers.constant.bit_vector_constant import UnsignedVectorConstant
@@ -50,15 +50,21 @@ class HtmlConstantTableGenerator(HtmlGeneratorCommon):
 
         self._html_translator = HtmlTranslator()
 
-    def get_code(self, **kwargs: Any) -> str:
+    def get_code(self, commit_info: Optional[str] = None, **kwargs: Any) -> str:
         """
         Get a HTML table with information about register constants.
+
+        Arguments:
+            commit_info: Commit information for the file header.
+                Can be given by a generator that includes this table in its own result,
+                and has already looked it up for the same source.
+                If not given, it is looked up here.
         """
         if not self.register_list.constants:
             return ""
 
         html = f"""\
-{self.header}
+{self._get_header(commit_info=commit_info)}
 <table>
 <thead>
   <tr>
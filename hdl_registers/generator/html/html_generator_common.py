@@ -7,6 +7,9 @@
 # https://github.com/hdl-registers/hdl-registers
 # --------------------------------------------------------------------------------------------------
 
+# Standard libraries
+from typing import Optional
+
 # First party libraries
 from hdl_registers.generator.register_code_generator import RegisterCodeGenerator
 
@@ -18,3 +21,17 @@ class HtmlGeneratorCommon(RegisterCodeGenerator):
 
     COMMENT_START = "<!--"
     COMMENT_END = " -->"
+
+    def _get_header(self, commit_info: Optional[str]) -> str:
+        """
+        Like :meth:`.header`, but with the given commit information, if any.
+        Used when the code is included in the result of another generator, which has already
+        looked up the commit information for the same source.
+        That lookup is slow.
+        """
+        if commit_info is None:
+            return self.header
+
+        return self.comment_block(
+            text=self._get_generated_source_info(commit_info=commit_info), indent=0
+        )
@@ -41,9 +41,14 @@ class HtmlPageGenerator(HtmlGeneratorCommon):
         """
         Get a complete HTML page with register and constant information.
         """
+        # Getting the commit information is slow.
+        # Do it once and use the result for this page as well as the tables included in it.
+        commit_info = self._get_commit_info()
+        generated_source_info = self._get_generated_source_info(commit_info=commit_info)
+
         title = f"Documentation of {self.name} registers"
         html = f"""\
-{self.header}
+{self.comment_block(text=generated_source_info, indent=0)}
 <!DOCTYPE html>
 <html>
 <head>
@@ -60,7 +65,7 @@ class HtmlPageGenerator(HtmlGeneratorCommon):
   <h1>{title}</h1>
   <p>This document is a specification for the register interface of the FPGA module \
 <b>{self.name}</b>.</p>
-  <p>{' '.join(self.generated_source_info)}</p>
+  <p>{' '.join(generated_source_info)}</p>
   <h2>Register modes</h2>
   <p>The following register modes are available.</p>
 {self._get_mode_descriptions()}
@@ -73,7 +78,7 @@ class HtmlPageGenerator(HtmlGeneratorCommon):
             )
             html += f"""
   <p>The following registers make up the register map.</p>
-{register_table_generator.get_code()}
+{register_table_generator.get_code(commit_info=commit_info)}
 """
         else:
             html += "  <p>This module does not have any registers.</p>"
@@ -85,7 +90,7 @@ class HtmlPageGenerator(HtmlGeneratorCommon):
             )
             html += f"""
   <p>The following constants are part of the register interface.</p>
-{constant_table_generator.get_code()}"""
+{constant_table_generator.get_code(commit_info=commit_info)}"""
         else:
             html += "  <p>This module does not have any constants.</p>"
 
@@ -51,12 +51,21 @@ class HtmlRegisterTableGenerator(HtmlGeneratorCommon):
 
         self._html_translator = HtmlTranslator()
 
-    def get_code(self, **kwargs: Any) -> str:
+    def get_code(self, commit_info: Optional[str] = None, **kwargs: Any) -> str:
+        """
+        Get a HTML table with information about registers and fields.
+
+        Arguments:
+            commit_info: Commit information for the file header.
+                Can be given by a generator that includes this table in its own result,
+                and has already looked it up for the same source.
+                If not given, it is looked up here.
+        """
         if not self.register_list.register_objects:
             return ""
 
         html = f"""\
-{self.header}
+{self._get_header(commit_info=commit_info)}
 <table>
 <thead>
   <tr>
@@ -90,8 +99,7 @@ class HtmlRegisterTableGenerator(HtmlGeneratorCommon):
         if value < 0:
             return "-"
 
-        formatting_string = f"0x{{:0{num_nibbles}X}}"
-        return formatting_string.format(value)
+        return f"0x{value:0{num_nibbles}X}"
 
     def _annotate_register_array(self, register_object: "RegisterArray") -> str:
         description = self._html_translator.translate(register_object.description)
@@ -240,6 +240,14 @@ def test_registers_and_constants(html_test):
     assert constants_text not in html, html
 
 
+def test_included_tables_state_their_own_generator(html_test):
+    html = html_test.create_html_page()
+
+    assert html.count("Code generator HtmlPageGenerator version") == 2, html
+    assert html.count("Code generator HtmlRegisterTableGenerator version") == 1, html
+    assert html.count("Code generator HtmlConstantTableGenerator version") == 1, html
+
+
 def test_constants_and_no_registers(html_test):
     html_test.register_list.register_objects = []
 
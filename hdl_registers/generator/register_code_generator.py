@@ -278,23 +278,18 @@ class RegisterCodeGenerator(ABC, RegisterCodeGeneratorHelpers):
         Return lines informing the user that the file is automatically generated.
         Containing info about the source of the generated register information.
         """
-        # Default: Get git SHA from the user's current working directory.
-        directory = Path(".")
+        return self._get_generated_source_info(commit_info=self._get_commit_info())
 
+    def _get_generated_source_info(self, commit_info: str) -> list[str]:
+        """
+        Lines for :meth:`.generated_source_info`, with the given commit information.
+        """
         time_info = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
 
         file_info = ""
         if self.register_list.source_definition_file is not None:
-            # If the source definition file does exist, get git SHA from that directory instead.
-            directory = self.register_list.source_definition_file.parent
             file_info = f" from file {self.register_list.source_definition_file.name}"
 
-        commit_info = ""
-        if git_commands_are_available(directory=directory):
-            commit_info = f" at commit {get_git_commit(directory=directory)}"
-        elif svn_commands_are_available(cwd=directory):
-            commit_info = f" at revision {get_svn_revision_information(cwd=directory)}"
-
         info = f"Generated {time_info}{file_info}{commit_info}."
 
         return [
@@ -307,6 +302,26 @@ class RegisterCodeGenerator(ABC, RegisterCodeGeneratorHelpers):
             f"Register hash {self.register_list.object_hash}.",
         ]
 
+    def _get_commit_info(self) -> str:
+        """
+        Information about the git commit or svn revision of the register source.
+        Getting this is by far the slowest part of generating an artifact.
+        """
+        # Default: Get git SHA from the user's current working directory.
+        directory = Path(".")
+
+        if self.register_list.source_definition_file is not None:
+            # If the source definition file does exist, get git SHA from that directory instead.
+            directory = self.register_list.source_definition_file.parent
+
+        if git_commands_are_available(directory=directory):
+            return f" at commit {get_git_commit(directory=directory)}"
+
+        if svn_commands_are_available(cwd=directory):
+            return f" at revision {get_svn_revision_information(cwd=directory)}"
+
+        return ""
+
     def _sanity_check(self) -> None:
         """
         Do some basic checks that no naming errors are present.
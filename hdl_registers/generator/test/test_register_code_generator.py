@@ -15,7 +15,7 @@ from unittest.mock import PropertyMock, patch
 
 # Third party libraries
 import pytest
-from tsfpga.system_utils import create_directory, create_file
+from tsfpga.system_utils import create_directory, create_file, read_file
 
 # First party libraries
 from hdl_registers import __version__ as hdl_registers_version
@@ -152,6 +152,22 @@ def test_create_should_run_again_if_register_list_is_modified(generator_from_tom
         mocked_create.assert_called_once()
 
 
+def test_create_twice_with_same_generator_after_register_list_is_modified(generator_from_toml):
+    generator = generator_from_toml()
+    generator.create()
+
+    generator.register_list.add_constant(name="apa", value=3, description="")
+    generator.create()
+
+    assert f"Register hash {generator.register_list.object_hash}." in read_file(
+        generator.output_file
+    )
+
+    with patch(f"{__name__}.CustomGenerator.create", autospec=True) as mocked_create:
+        generator.create_if_needed()
+        mocked_create.assert_not_called()
+
+
 def test_create_should_run_again_if_package_version_is_changed(generator_from_toml):
     generator = generator_from_toml()
     generator.create_if_needed()
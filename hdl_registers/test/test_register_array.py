@@ -11,6 +11,7 @@
 import pytest
 
 # First party libraries
+from hdl_registers.register import Register
 from hdl_registers.register_array import RegisterArray
 from hdl_registers.register_modes import REGISTER_MODES
 
@@ -40,6 +41,15 @@ def test_get_register():
     assert register_array.get_register("hest") is hest
     assert register_array.get_register("zebra") is zebra
 
+    # Registers appended after a lookup shall also be found.
+    apa = register_array.append_register(name="apa", mode=REGISTER_MODES["r"], description="")
+    assert register_array.get_register("apa") is apa
+
+    # Registers put directly in the list, without 'append_register', shall also be found.
+    zoo = Register(name="zoo", index=0, mode=REGISTER_MODES["r"], description="")
+    register_array.registers = [zoo]
+    assert register_array.get_register("zoo") is zoo
+
     with pytest.raises(ValueError) as exception_info:
         assert register_array.get_register("non existing") is None
     assert (
@@ -0,0 +1,38 @@
+# --------------------------------------------------------------------------------------------------
+# Copyright (c) Lukas Vik. All rights reserved.
+#
+# This file is part of the hdl-registers project, an HDL register generator fast enough to run
+# in real time.
+# https://hdl-registers.com
+# https://github.com/hdl-registers/hdl-registers
+# --------------------------------------------------------------------------------------------------
+
+# Third party libraries
+import pytest
+from tsfpga.system_utils import load_python_module
+
+# First party libraries
+from hdl_registers import HDL_REGISTERS_DOC
+
+# The documentation examples that show both TOML and Python API usage.
+EXAMPLE_FILES = [
+    py_file
+    for py_file in sorted((HDL_REGISTERS_DOC / "sphinx" / "rst").glob("*/py/*.py"))
+    if "def create_from_api(" in py_file.read_text(encoding="utf-8")
+]
+
+
+@pytest.mark.parametrize("py_file", EXAMPLE_FILES, ids=lambda py_file: py_file.stem)
+def test_toml_and_api_examples_give_identical_register_lists(py_file):
+    """
+    The documentation states that the result of 'parse_toml' and 'create_from_api' is identical.
+    Check here that the statement is true.
+    """
+    module = load_python_module(py_file)
+
+    toml_register_list = module.parse_toml()
+    # Is the only thing that shall differ.
+    assert toml_register_list.source_definition_file is not None
+    toml_register_list.source_definition_file = None
+
+    assert repr(toml_register_list) == repr(module.create_from_api())
@@ -8,11 +8,14 @@
 # --------------------------------------------------------------------------------------------------
 
 # Standard libraries
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
 # Third party libraries
 import pytest
+from tsfpga import DEFAULT_FILE_ENCODING
 from tsfpga.system_utils import create_file, run_command
 
 # First party libraries
@@ -23,19 +26,31 @@ from tests.functional.gcc.compile_and_run_test import CompileAndRunTest
 
 THIS_DIR = Path(__file__).parent.resolve()
 
+# Use ccache, if available, so that identical compilations are not repeated.
+# Neither between tests, nor between test sessions.
+CCACHE = shutil.which("ccache")
+
+
+# False positive for pytest fixtures
+# pylint: disable=redefined-outer-name
+
 
 class BaseCppTest(CompileAndRunTest):
+    def __init__(self, tmp_path: Path, generated_cpp_path: Path) -> None:
+        super().__init__(tmp_path=tmp_path)
+
+        self.generated_cpp_path = generated_cpp_path
+
     @staticmethod
     def get_main(includes="", test_code=""):
         return f"""\
 #include <assert.h>
-#include <iostream>
 
 #include "include/caesar.h"
 
 {includes}
 
-int main()
+int main(int argc, char *argv[])
 {{
   uint32_t memory[fpga_regs::Caesar::num_registers];
   volatile uint8_t *base_address = reinterpret_cast<volatile uint8_t *>(memory);
@@ -51,22 +66,28 @@ int main()
         include_directories = [] if include_directories is None else include_directories
         source_files = [] if source_files is None else source_files
 
-        CppInterfaceGenerator(self.register_list, self.include_dir).create()
-        CppHeaderGenerator(self.register_list, self.include_dir).create()
-        CppImplementationGenerator(self.register_list, self.working_dir).create()
-        cpp_class_file = self.working_dir / "caesar.cpp"
+        generated_folder = self.generate()
+        include_dir = generated_folder / "include"
+        cpp_class_object_file = generated_folder / "caesar.o"
 
         main_file = self.working_dir / "main.cpp"
 
         executable = self.working_dir / "test.o"
 
-        compile_command = (
+        compile_arguments = (
             [
-                "g++",
+                # The test code does not need optimization, debug info, exceptions or RTTI.
+                # The generated class implementation is compiled separately with default settings.
+                "-O0",
+                "-g0",
+                "-fno-exceptions",
+                "-fno-rtti",
                 f"-o{executable}",
-                f"-I{self.include_dir}",
+                # For the '#include "include/caesar.h"' in the generated code.
+                f"-I{generated_folder}",
+                f"-I{include_dir}",
                 main_file,
-                cpp_class_file,
+                cpp_class_object_file,
             ]
             + [f"-I{path}" for path in include_directories]
             + source_files
@@ -74,19 +95,68 @@ int main()
 
         create_file(file=main_file, contents=self.get_main(includes=includes, test_code=test_code))
 
-        run_command(compile_command)
+        self.run_compiler(arguments=compile_arguments, cwd=self.working_dir)
 
         # Return the command that runs the executable.
         return [str(executable)]
 
-
-@pytest.fixture
-def base_cpp_test(tmp_path):
-    return BaseCppTest(tmp_path=tmp_path)
-
-
-# False positive for pytest fixtures
-# pylint: disable=redefined-outer-name
+    def generate(self):
+        """
+        Generate C++ code from the current register list, and compile the class implementation
+        to an object file.
+        Most tests use the same register list, so the result is shared between all tests in the
+        session, in a folder that is unique for the register list.
+
+        Return:
+            The folder where the code and object file were placed.
+        """
+        output_folder = self.generated_cpp_path / self.register_list.object_hash
+        include_dir = output_folder / "include"
+
+        # Will not do anything if the code was generated by a previous test.
+        CppInterfaceGenerator(self.register_list, include_dir).create_if_needed()
+        CppHeaderGenerator(self.register_list, include_dir).create_if_needed()
+        cpp_class_created, cpp_class_file = CppImplementationGenerator(
+            self.register_list, output_folder
+        ).create_if_needed()
+
+        object_file = output_folder / "caesar.o"
+        if cpp_class_created or not object_file.exists():
+            self.run_compiler(
+                arguments=["-c", f"-o{object_file}", f"-I{output_folder}", cpp_class_file],
+                cwd=output_folder,
+            )
+
+        return output_folder
+
+    def run_compiler(self, arguments, cwd):
+        # Use pipes rather than temporary files between the compilation stages.
+        arguments = ["-pipe"] + arguments
+
+        if CCACHE is None:
+            run_command(cmd=["g++"] + arguments, cwd=cwd)
+            return
+
+        env = dict(os.environ)
+        # Absolute paths within the pytest temporary directory differ between test sessions.
+        # With this setting, ccache will use paths relative to 'cwd' instead.
+        env["CCACHE_BASEDIR"] = str(self.generated_cpp_path.parent)
+        # Headers are re-generated in every session, so their timestamps are always new.
+        env["CCACHE_SLOPPINESS"] = "include_file_ctime,include_file_mtime,time_macros"
+
+        run_command(cmd=[CCACHE, "g++"] + arguments, cwd=cwd, env=env)
+
+
+@pytest.fixture(scope="session")
+def generated_cpp_path(tmp_path_factory):
+    """
+    Generated C++ code is shared between all tests in the session, see 'BaseCppTest.generate'.
+
+    When running tests in parallel with pytest-xdist, each worker has its own session and its own
+    temporary directory.
+    Hence there is no risk of workers writing the same files at the same time.
+    """
+    return tmp_path_factory.mktemp("cpp_generated")
 
 
 class CppTest(BaseCppTest):
@@ -111,8 +181,8 @@ class CppTest(BaseCppTest):
 
 
 @pytest.fixture
-def cpp_test(tmp_path):
-    return CppTest(tmp_path=tmp_path)
+def cpp_test(tmp_path, generated_cpp_path):
+    return CppTest(tmp_path=tmp_path, generated_cpp_path=generated_cpp_path)
 
 
 def test_cpp_with_registers_and_constants(cpp_test):
@@ -129,89 +199,106 @@ def test_cpp_with_only_constants(cpp_test):
     cpp_test.compile_and_run(test_registers=False, test_constants=True)
 
 
-def test_setting_cpp_register_array_out_of_bounds_should_crash(base_cpp_test):
-    test_code = """\
-  // Index 3 is out of bounds (should be less than 3)
-  caesar.set_dummies_first(3, 1337);
+class CrashTest(BaseCppTest):
+    """
+    Compile all the test cases that check for crashes into one executable, to save time.
+    The test case to run, and the value to use, are selected with command line arguments.
+    """
+
+    TEST_CASES = {
+        "set_register_array": "caesar.set_dummies_first(value, 1337);",
+        "set_integer_field": "caesar.set_config_plain_integer(value);",
+        # 'config' register is index 0 and 'plain_integer' field starts at bit 5.
+        "get_integer_field": """\
+    memory[0] = value << 5;
+    caesar.get_config_plain_integer();""",
+        "set_bit_vector_field": "caesar.set_config_plain_bit_vector(value);",
+    }
+
+    def __init__(self, tmp_path: Path, generated_cpp_path: Path) -> None:
+        super().__init__(tmp_path=tmp_path, generated_cpp_path=generated_cpp_path)
+
+        # Usage: <executable> <test case> <value>
+        test_code = """\
+assert(argc == 3);
+  const int value = atoi(argv[2]);
+"""
+        for test_case, code in self.TEST_CASES.items():
+            test_code += f"""
+  if (strcmp(argv[1], "{test_case}") == 0)
+  {{
+    {code}
+  }}
 """
-    cmd = base_cpp_test.compile(test_code=test_code)
 
-    with pytest.raises(subprocess.CalledProcessError):
-        result = run_command(cmd=cmd, capture_output=True)
-        assert result.stdout == ""
-        assert (
-            "Assertion `array_index < caesar::dummies::array_length' failed" in result.stderr
-        ), result.stderr
+        self.command = self.compile(
+            test_code=test_code, includes="#include <cstdlib>\n#include <cstring>"
+        )
 
+    def run(self, test_case, value):
+        assert test_case in self.TEST_CASES, test_case
 
-def test_setting_cpp_integer_field_out_of_range_should_crash(base_cpp_test):
-    test_code = """\
-  caesar.set_config_plain_integer(-1024);
-"""
-    cmd = base_cpp_test.compile(test_code=test_code)
+        # Not using 'run_command', since a non-zero exit code is the expected outcome for
+        # most test cases.
+        return subprocess.run(
+            args=self.command + [test_case, str(value)],
+            check=False,
+            encoding=DEFAULT_FILE_ENCODING,
+            capture_output=True,
+        )
 
-    with pytest.raises(subprocess.CalledProcessError):
-        result = run_command(cmd=cmd, capture_output=True)
-        assert result.stdout == ""
-        assert "Assertion `field_value >= -50' failed." in result.stderr, result.stderr
 
-    test_code = """\
-  caesar.set_config_plain_integer(110);
-"""
-    cmd = base_cpp_test.compile(test_code=test_code)
+@pytest.fixture(scope="session")
+def crash_test(tmp_path_factory, generated_cpp_path):
+    return CrashTest(
+        tmp_path=tmp_path_factory.mktemp("crash_test"), generated_cpp_path=generated_cpp_path
+    )
 
-    with pytest.raises(subprocess.CalledProcessError):
-        result = run_command(cmd=cmd, capture_output=True)
-        assert result.stdout == ""
-        assert "Assertion `field_value <= 100' failed." in result.stderr, result.stderr
 
+def test_setting_cpp_register_array_out_of_bounds_should_crash(crash_test):
+    # Index 3 is out of bounds (should be less than 3).
+    result = crash_test.run("set_register_array", 3)
+    assert result.returncode != 0
+    assert result.stdout == ""
+    assert (
+        "Assertion `array_index < caesar::dummies::array_length' failed." in result.stderr
+    ), result.stderr
 
-def test_getting_cpp_integer_field_out_of_range_should_crash(base_cpp_test):
-    # 'config' register is index 0 and 'plain_integer' field starts at bit 9.
-    test_code = """\
-  memory[0] = 100 << 5;
-  caesar.get_config_plain_integer();
-"""
-    cmd = base_cpp_test.compile(test_code=test_code)
-    run_command(cmd=cmd, capture_output=True)
 
-    test_code = """\
-  memory[0] = 101 << 5;
-  caesar.get_config_plain_integer();
-"""
-    cmd = base_cpp_test.compile(test_code=test_code)
+def test_setting_cpp_integer_field_out_of_range_should_crash(crash_test):
+    result = crash_test.run("set_integer_field", -1024)
+    assert result.returncode != 0
+    assert result.stdout == ""
+    assert "Assertion `field_value >= -50' failed." in result.stderr, result.stderr
 
-    with pytest.raises(subprocess.CalledProcessError):
-        result = run_command(cmd=cmd, capture_output=True)
-        assert result.stdout == ""
-        assert "Assertion `field_value <= 100' failed." in result.stderr, result.stderr
+    result = crash_test.run("set_integer_field", 110)
+    assert result.returncode != 0
+    assert result.stdout == ""
+    assert "Assertion `field_value <= 100' failed." in result.stderr, result.stderr
 
-    test_code = """\
-  memory[0] = -51 << 5;
-  caesar.get_config_plain_integer();
-"""
-    cmd = base_cpp_test.compile(test_code=test_code)
 
-    with pytest.raises(subprocess.CalledProcessError):
-        result = run_command(cmd=cmd, capture_output=True)
-        assert result.stdout == ""
-        assert "Assertion `field_value >= -51' failed." in result.stderr, result.stderr
+def test_getting_cpp_integer_field_out_of_range_should_crash(crash_test):
+    result = crash_test.run("get_integer_field", 100)
+    assert result.returncode == 0, result.stderr
 
+    result = crash_test.run("get_integer_field", 101)
+    assert result.returncode != 0
+    assert result.stdout == ""
+    assert "Assertion `field_value <= 100' failed." in result.stderr, result.stderr
 
-def test_setting_cpp_bit_vector_field_out_of_range_should_crash(base_cpp_test):
-    test_code = """\
-  caesar.set_config_plain_bit_vector(15);
-"""
-    cmd = base_cpp_test.compile(test_code=test_code)
-    run_command(cmd=cmd, capture_output=True)
+    result = crash_test.run("get_integer_field", -51)
+    assert result.returncode != 0
+    assert result.stdout == ""
+    assert "Assertion `field_value >= -50' failed." in result.stderr, result.stderr
 
-    test_code = """\
-  caesar.set_config_plain_bit_vector(16);
-"""
-    cmd = base_cpp_test.compile(test_code=test_code)
-    with pytest.raises(subprocess.CalledProcessError):
-        result = run_command(cmd=cmd, capture_output=True)
-        assert result.stdout == ""
-        assert (
-            "Assertion `field_value & mask_at_base_inverse == 0' failed." in result.stderr
-        ), result.stderr
+
+def test_setting_cpp_bit_vector_field_out_of_range_should_crash(crash_test):
+    result = crash_test.run("set_bit_vector_field", 15)
+    assert result.returncode == 0, result.stderr
+
+    result = crash_test.run("set_bit_vector_field", 16)
+    assert result.returncode != 0
+    assert result.stdout == ""
+    assert (
+        "Assertion `(field_value & mask_at_base_inverse) == 0' failed." in result.stderr
+    ), result.stderr
@@ -9,18 +9,33 @@
 
 # Standard libraries
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Third party libraries
+from mypy import api as mypy_api
 from tsfpga.git_utils import find_git_files
-from tsfpga.system_utils import create_file, run_command
+from tsfpga.system_utils import create_file
 from tsfpga.test.lint.python_lint import run_black, run_flake8_lint, run_isort, run_pylint
 
 # First party libraries
 from hdl_registers import HDL_REGISTERS_DOC, REPO_ROOT
 
+# Default locations of tsfpga and VUnit repo checkouts, e.g.
+# repo/hdl-registers/hdl-registers
+# repo/tsfpga/tsfpga
+# repo/vunit/vunit
+REPOS_ROOT = REPO_ROOT.parent.parent.resolve()
+PATH_TO_TSFPGA = REPOS_ROOT / "tsfpga" / "tsfpga"
+PATH_TO_VUNIT = REPOS_ROOT / "vunit" / "vunit"
 
+
+@lru_cache(maxsize=1)
 def _files_to_check():
+    """
+    Searching the git repo is quite slow, and the result is the same for every lint test.
+    Hence the result is cached.
+    """
     # Exclude doc folder, since conf.py used by sphinx does not conform
     exclude_directories = [HDL_REGISTERS_DOC]
 
@@ -50,12 +65,10 @@ def test_isort_formatting():
     run_isort(files=_files_to_check(), cwd=REPO_ROOT)
 
 
-def test_mypy():
-    command = [sys.executable, "-m", "mypy", "--package", "hdl_registers", "--package", "tools"]
-
+def test_mypy(monkeypatch):
     # Add to PYTHONPATH so that mypy can find everything
-    sys.path.append(str(REPO_ROOT.parent.parent.resolve() / "tsfpga" / "tsfpga"))
-    sys.path.append(str(REPO_ROOT.parent.parent.resolve() / "vunit" / "vunit"))
+    sys.path.append(str(PATH_TO_TSFPGA))
+    sys.path.append(str(PATH_TO_VUNIT))
 
     # Third party libraries
     import vunit  # pylint: disable=import-outside-toplevel
@@ -63,5 +76,9 @@ def test_mypy():
     # Create the py.typed file that is currently missing in VUnit.
     create_file(Path(vunit.__file__).parent / "py.typed")
 
-    env = dict(PYTHONPATH=":".join(sys.path))
-    run_command(cmd=command, cwd=REPO_ROOT, env=env)
+    # Run mypy in this process rather than in a subprocess, to save the Python startup time.
+    # Since the current interpreter is used, mypy will search the 'sys.path' set up above.
+    # Packages in the working directory are checked as source code, so it must be the repo root.
+    monkeypatch.chdir(REPO_ROOT)
+    stdout, stderr, exit_status = mypy_api.run(["--package", "hdl_registers", "--package", "tools"])
+    assert exit_status == 0, f"{stdout}\n{stderr}"
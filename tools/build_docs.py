@@ -9,6 +9,7 @@
 
 # Standard libraries
 import argparse
+import hashlib
 import shutil
 import sys
 from pathlib import Path
@@ -107,10 +108,21 @@ def generate_register_code() -> None:
     # Set the path environment variable in the python calls below so they find e.g. tsfpga.
     env = dict(PYTHONPATH=":".join(sys.path))
 
+    common_source_hash = get_register_code_common_source_hash()
+
     for folder in (SPHINX_DOC / "rst").glob("*"):
         for py_file in (folder / "py").glob("*.py"):
             output_folder = GENERATED_SPHINX / "register_code" / folder.name / py_file.stem
 
+            # Parsing and generating is slow compared to hashing the inputs.
+            # If nothing that affects the result has changed since the previous build, the
+            # artifacts from that build can be used as they are.
+            source_hash_file = output_folder / "source_hash.txt"
+            source_hash = hashlib.sha1(common_source_hash + py_file.read_bytes()).hexdigest()
+            if source_hash_file.exists() and read_file(source_hash_file) == source_hash:
+                print(f"Register code from {py_file.name} is up to date.")
+                continue
+
             command = [sys.executable, str(py_file), str(output_folder)]
             status = run_command(
                 cmd=command, cwd=hdl_registers.REPO_ROOT, env=env, capture_output=True
@@ -122,6 +134,30 @@ def generate_register_code() -> None:
             if status.stderr:
                 print(status.stderr)
 
+            create_file(file=source_hash_file, contents=source_hash)
+
+
+def get_register_code_common_source_hash() -> bytes:
+    """
+    Hash of all the files, apart from the script itself, that can affect the result of a
+    documentation register code script.
+    I.e. all the register data files (that might be shared between scripts), and the Python source
+    code of the generators.
+    """
+    files = [
+        path
+        for path in (SPHINX_DOC / "rst").glob("*/*/*")
+        if path.suffix in [".toml", ".json", ".yaml"]
+    ]
+    files += list(hdl_registers.HDL_REGISTERS_PATH.glob("**/*.py"))
+
+    hash_object = hashlib.sha1()
+    for path in sorted(files):
+        hash_object.update(str(path.relative_to(hdl_registers.REPO_ROOT)).encode())
+        hash_object.update(path.read_bytes())
+
+    return hash_object.digest()
+
 
 def generate_bibtex() -> None:
     """